@@ -10,6 +10,7 @@ import os
 import zipfile
 import urllib.request
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Iterator, Any
 from utils import log_event, log_error, log_warning, ensure_directory_exists, format_bytes
 
@@ -24,6 +25,11 @@ class Downloader:
     DESTINATION_PATTERN = re.compile(r'\[download\] Destination:\s+(.+)')
     YOUTUBE_ID_PATTERN = re.compile(r'\[youtube\]\s+(.+?):\s+Downloading webpage')
     
+    # Worker count for per-video info lookups. Each worker runs a full yt-dlp
+    # process and every one of them queries YouTube at the same time, so this
+    # is a small fixed cap to keep memory use down and avoid rate limiting.
+    INFO_FETCH_WORKERS = 4
+    
     def __init__(self, archive_path: str = "archive.txt", cookies_file: Optional[str] = None):
         """
         Initialize the downloader
@@ -37,7 +43,7 @@ class Downloader:
         self.ffmpeg_path: Optional[str] = None
         self.setup_ffmpeg()
         
-        log_event(f"Downloader initialized: archive={archive_path}, cookies={bool(cookies_file)}")
+        log_event("Downloader initialized: archive=%s, cookies=%s", archive_path, bool(cookies_file))
 
     def setup_ffmpeg(self) -> None:
         """Set up FFmpeg for video/audio merging"""
@@ -54,7 +60,7 @@ class Downloader:
             # Linux/macOS: Use system FFmpeg
             self._setup_ffmpeg_unix()
         
-        log_event(f"FFmpeg setup complete: {self.ffmpeg_path}")
+        log_event("FFmpeg setup complete: %s", self.ffmpeg_path)
 
     def _download_ffmpeg(self, ffmpeg_dir: str) -> None:
         """
@@ -72,7 +78,7 @@ class Downloader:
                 self._setup_ffmpeg_unix()
                 
         except Exception as e:
-            log_error(f"FFmpeg download failed: {str(e)}")
+            log_error("FFmpeg download failed: %s", e)
             self.ffmpeg_path = "ffmpeg"  # Fallback to system PATH
 
     def _download_ffmpeg_windows(self, ffmpeg_dir: str) -> None:
@@ -172,7 +178,7 @@ class Downloader:
             return False
             
         except Exception as e:
-            log_error(f"FFmpeg check failed: {e}")
+            log_error("FFmpeg check failed: %s", e)
             return False
 
     def get_video_info(self, url: str) -> Tuple[Optional[List[Dict]], Optional[str]]:
@@ -185,7 +191,7 @@ class Downloader:
         Returns:
             Tuple of (video_list, error_message)
         """
-        log_event(f"Getting video info for URL: {url}")
+        log_event("Getting video info for URL: %s", url)
         
         try:
             # Handle playlist URLs specially
@@ -195,7 +201,7 @@ class Downloader:
                 return self._get_video_info_flat(url)
                 
         except Exception as e:
-            log_error(f"Failed to get video info: {e}")
+            log_error("Failed to get video info: %s", e)
             return None, str(e)
 
     def _is_playlist_url(self, url: str) -> bool:
@@ -210,17 +216,17 @@ class Downloader:
         result = subprocess.run(command, capture_output=True, text=True, encoding='utf-8')
         
         if result.returncode != 0:
-            log_error(f"Playlist info failed: {result.stderr}")
+            log_error("Playlist info failed: %s", result.stderr)
             return None, result.stderr
             
         try:
             data = json.loads(result.stdout)
             if data.get("_type") == "playlist" and "entries" in data:
                 videos = [entry for entry in data["entries"] if entry]
-                log_event(f"Found {len(videos)} videos in playlist")
+                log_event("Found %s videos in playlist", len(videos))
                 return videos, None
         except json.JSONDecodeError as e:
-            log_error(f"JSON parsing failed: {e}")
+            log_error("JSON parsing failed: %s", e)
             return None, str(e)
             
         return None, "No playlist data found"
@@ -233,7 +239,7 @@ class Downloader:
         result = subprocess.run(command, capture_output=True, text=True, encoding='utf-8')
         
         if result.returncode != 0:
-            log_error(f"Video info failed: {result.stderr}")
+            log_error("Video info failed: %s", result.stderr)
             return None, result.stderr
             
         videos = []
@@ -260,10 +266,10 @@ class Downloader:
         # Get detailed info for playlist videos
         if is_playlist and playlist_video_ids:
             detailed_videos = self._get_detailed_video_info(playlist_video_ids)
-            log_event(f"Found {len(detailed_videos)} videos in playlist")
+            log_event("Found %s videos in playlist", len(detailed_videos))
             return detailed_videos, None
         
-        log_event(f"Found {len(videos)} videos")
+        log_event("Found %s videos", len(videos))
         return videos, None
 
     def _is_playlist_data(self, data: Dict) -> bool:
@@ -289,22 +295,29 @@ class Downloader:
 
     def _get_detailed_video_info(self, video_ids: List[str]) -> List[Dict]:
         """Get detailed information for a list of video IDs"""
-        detailed_videos = []
+        if not video_ids:
+            return []
+        
+        workers = min(self.INFO_FETCH_WORKERS, len(video_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="val") as executor:
+            results = executor.map(self._fetch_single_video_info, video_ids)
+            # map() preserves playlist order; failed lookups are dropped
+            return [info for info in results if info is not None]
+
+    def _fetch_single_video_info(self, vid_id: str) -> Optional[Dict]:
+        """Run yt-dlp --dump-json for a single video ID"""
+        vid_url = f"https://www.youtube.com/watch?v={vid_id}"
+        command = self._build_base_command(["--dump-json"])
+        command.append(vid_url)
         
-        for vid_id in video_ids:
-            vid_url = f"https://www.youtube.com/watch?v={vid_id}"
-            command = self._build_base_command(["--dump-json"])
-            command.append(vid_url)
-            
-            result = subprocess.run(command, capture_output=True, text=True, encoding='utf-8')
-            
-            if result.returncode == 0:
-                try:
-                    detailed_videos.append(json.loads(result.stdout.strip()))
-                except json.JSONDecodeError:
-                    continue
-                    
-        return detailed_videos
+        result = subprocess.run(command, capture_output=True, text=True, encoding='utf-8')
+        
+        if result.returncode != 0:
+            return None
+        try:
+            return json.loads(result.stdout.strip())
+        except json.JSONDecodeError:
+            return None
 
     def _build_base_command(self, base_args: List[str]) -> List[str]:
         """Build base yt-dlp command with common arguments"""
@@ -334,12 +347,12 @@ class Downloader:
             Progress updates as dictionaries
         """
         thread_id = download_options.get("thread_id", "unknown")
-        log_event(f"Starting download: urls={len(urls)}, thread_id={thread_id}")
+        log_event("Starting download: urls=%s, thread_id=%s", len(urls), thread_id)
         
         base_command = self._build_download_command(download_options, output_path)
         
         for url in urls:
-            log_event(f"Downloading: {url}")
+            log_event("Downloading: %s", url)
             command = base_command + [url]
             
             yield {"type": "status", "message": f"Starting download for: {url}"}
@@ -347,7 +360,7 @@ class Downloader:
             for progress_update in self._run_yt_dlp_command(command, thread_id):
                 yield progress_update
                 
-            log_event(f"Download completed: {url}")
+            log_event("Download completed: %s", url)
 
     def _build_download_command(self, download_options: Dict[str, Any], 
                                output_path: str) -> List[str]:
@@ -404,7 +417,7 @@ class Downloader:
         
         format_string = format_map.get(quality, "bestvideo[height>=720]+bestaudio/best[height>=720]/bestvideo+bestaudio/best")
         command.extend(["-f", format_string])
-        log_event(f"Quality format: {format_string}")
+        log_event("Quality format: %s", format_string)
 
     def _add_subtitle_options(self, command: List[str], options: Dict[str, Any]) -> None:
         """Add subtitle options to command"""
@@ -434,7 +447,7 @@ class Downloader:
         Yields:
             Progress updates
         """
-        log_event(f"Executing: {' '.join(command)}")
+        log_event("Executing: %s", ' '.join(command))
         
         try:
             process = subprocess.Popen(
@@ -448,7 +461,7 @@ class Downloader:
                 errors='replace'
             )
         except Exception as e:
-            log_error(f"Failed to start process: {e}")
+            log_error("Failed to start process: %s", e)
             yield {"type": "error", "message": str(e), "thread_id": thread_id}
             return
         
@@ -477,7 +490,7 @@ class Downloader:
         stderr_output = process.stderr.read() if process.stderr else ""
         
         if process.returncode != 0:
-            log_error(f"yt-dlp failed: {stderr_output}")
+            log_error("yt-dlp failed: %s", stderr_output)
             yield {
                 "type": "error", 
                 "message": stderr_output.strip(), 
@@ -560,4 +573,4 @@ class Downloader:
             cookies_file: Path to cookies file
         """
         self.cookies_file = cookies_file
-        log_event(f"Cookies file set: {cookies_file}")
+        log_event("Cookies file set: %s", cookies_file)
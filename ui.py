@@ -6,19 +6,51 @@ Modern Flet-based GUI for YouTube video downloading
 import flet as ft
 from downloader import Downloader
 import threading
+import queue
 import os
 import subprocess
+import socket
+import shutil
 import sys
-from utils import log_event, log_error, log_warning, get_disk_space, format_bytes
+from utils import (
+    log_event, log_error, log_warning, format_bytes, tail_lines, count_lines, LOG_FILE,
+    get_yt_dlp_version, check_ffmpeg, refresh_tool_checks,
+)
 from typing import Dict, List, Optional
-import queue
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 import time
+import random
+from functools import partial
+from itertools import count
+from collections import namedtuple
+
+GIB = 1 << 30
+
+# Static paths, resolved once at import
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+COOKIE_EXTRACTOR_SCRIPT = os.path.join(MODULE_DIR, "cookie_extractor.py")
+DEFAULT_COOKIES_FILE = os.path.join(MODULE_DIR, "youtube_cookies.txt")
+
+# Verbose [DEBUG] console output, off unless YTDLP_GUI_DEBUG=1
+_DEBUG = os.environ.get("YTDLP_GUI_DEBUG") == "1"
 
 # Global variables for progress tracking
-progress_event_queue = queue.Queue()
-download_counter = 0
+# itertools.count.__next__ is atomic, so worker threads can draw ids without a lock
+_download_counter = count(1)
+
+# Session-wide download workers. Downloads are queued in submission order and a
+# single dispatcher hands them to the pool only when a slot is free, so they start
+# in order and repeated Start clicks share the same limit
+_download_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="dl")
+_download_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_dispatcher_lock = threading.Lock()
+_dispatcher_started = False
+# Upper bound (seconds) of the random delay before each download's first request
+DOWNLOAD_START_JITTER = 0.2
+# Error messages are cut to this many characters before they reach the UI
+# (yt-dlp can report a whole stderr dump; the full text is in the log)
+ERROR_MESSAGE_MAX = 500
 
 # UI Configuration constants
 UI_CONFIG = {
@@ -38,6 +70,251 @@ UI_CONFIG = {
     }
 }
 
+# Frequently used layout values, resolved once at import
+_SPACING = UI_CONFIG["spacing"]
+_BORDER_COLOR = UI_CONFIG["colors"]["border"]
+_C_PRIMARY = UI_CONFIG["colors"]["primary"]
+_C_SUCCESS = UI_CONFIG["colors"]["success"]
+_C_ERROR = UI_CONFIG["colors"]["error"]
+_C_INFO = UI_CONFIG["colors"]["info"]
+_PROGRESS_H = UI_CONFIG["progress_height"]
+_THUMB_W = UI_CONFIG["thumbnail_size"]["width"]
+_THUMB_H = UI_CONFIG["thumbnail_size"]["height"]
+
+# Finished video card look per status: (badge text, badge color, background, border);
+# the border objects are shared by every card
+_CARD_STYLES = {
+    "completed": ("Done", _C_SUCCESS, "#1B4332", ft.border.all(2, "#40916C")),  # Dark green
+    "error": ("Error", _C_ERROR, "#4A1A1A", ft.border.all(2, "#DC2626")),  # Dark red
+}
+
+# Shared, immutable style pieces of the video cards
+_SEP_STYLE = {"size": 10, "color": "#444"}
+_BADGE_PADDING = ft.padding.symmetric(horizontal=4, vertical=1)
+_BADGE_MARGIN = ft.margin.only(top=1)
+_THUMB_MARGIN = ft.margin.only(right=8)
+_CHECKBOX_MARGIN = ft.margin.only(left=6)
+_CARD_MARGIN = ft.margin.only(bottom=4)
+
+# Progress events are collected for this long (seconds) before one UI flush
+PROGRESS_FLUSH_INTERVAL = 0.1
+
+# Video cards are built this many at a time; the rest are added as the list
+# is scrolled to within VIDEO_LIST_LOAD_MARGIN pixels of its end
+VIDEO_CARD_PAGE_SIZE = 50
+VIDEO_LIST_LOAD_MARGIN = 300
+
+# (language code, display name) pairs for the subtitle/translate dropdowns
+SUBTITLE_OPTIONS = (
+    ("en", "English"),
+    ("tr", "Türkçe"),
+    ("es", "Español"),
+    ("fr", "Français"),
+    ("de", "Deutsch"),
+    ("it", "Italiano"),
+    ("pt", "Português"),
+    ("ru", "Русский"),
+    ("ja", "日本語"),
+    ("ko", "한국어"),
+    ("zh", "中文"),
+    ("ar", "العربية"),
+    ("hi", "हिन्दी"),
+)
+SUBTITLE_ALL_OPTION = ("all", "All Available")
+
+class ProgressRow:
+    """Latest known state of a single download"""
+    # __slots__ by hand: dataclass(slots=True) needs Python 3.10, the app supports 3.7+
+    __slots__ = ("title", "ext", "size", "percent", "eta", "speed")
+    
+    def __init__(self, title: str, ext: str, size: str, percent: float, eta: str, speed: str):
+        self.title = title
+        self.ext = ext
+        self.size = size
+        self.percent = percent
+        self.eta = eta
+        self.speed = speed
+    
+    @classmethod
+    def from_update(cls, update: Dict[str, any]) -> "ProgressRow":
+        """Build a row from a downloader "progress" event"""
+        return cls(
+            update.get('title', 'Unknown'),
+            update.get('ext', 'Unknown'),
+            update.get('total_size', 'Unknown'),
+            update.get('percent', 0),
+            update.get('eta', 'Unknown'),
+            update.get('speed', 'Unknown'),
+        )
+    
+    def progress_line(self) -> str:
+        """Format the row as a progress display line"""
+        return f"📥 {self.title} ({self.ext}) - {self.percent:.1f}% of {self.size} at {self.speed} | ETA: {self.eta}"
+
+# A downloader event tagged with the download batch and video it belongs to; the event dict
+# itself is not modified. card_index is only meaningful while batch is still the current one.
+# For "progress" events the download worker also fills in row and its formatted display line.
+ProgressUpdate = namedtuple("ProgressUpdate", "batch video_url card_index data row display", defaults=(None, None))
+
+class ProgressRing:
+    """
+    Multi-producer, single-consumer ring buffer for download events
+    
+    Producers write a slot under one short lock; the consumer takes every
+    pending event with a single drain() call. If producers get a full ring
+    ahead of the consumer the buffer doubles instead of dropping events.
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize the ring
+        
+        Args:
+            capacity: Initial slot count, must be a power of two
+        """
+        self._buf: List[Optional[ProgressUpdate]] = [None] * capacity
+        self._mask = capacity - 1
+        self._head = 0  # next slot to read
+        self._tail = 0  # next slot to write
+        self._lock = threading.Lock()
+        self._not_empty = threading.Event()
+    
+    def put(self, update: ProgressUpdate) -> None:
+        """Append an event and wake the consumer"""
+        with self._lock:
+            if self._tail - self._head > self._mask:
+                self._grow()
+            self._buf[self._tail & self._mask] = update
+            self._tail += 1
+        self._not_empty.set()
+    
+    def wait(self) -> None:
+        """Block until at least one put() happened since the last wait()"""
+        self._not_empty.wait()
+        self._not_empty.clear()
+    
+    def wake(self) -> None:
+        """Release a consumer blocked in wait() without adding an event"""
+        self._not_empty.set()
+    
+    def drain(self) -> List[ProgressUpdate]:
+        """Remove and return all pending events in arrival order"""
+        with self._lock:
+            buf, mask = self._buf, self._mask
+            items = []
+            for i in range(self._head, self._tail):
+                items.append(buf[i & mask])
+                buf[i & mask] = None
+            self._head = self._tail
+        return items
+    
+    def clear(self) -> None:
+        """Discard all pending events"""
+        with self._lock:
+            self._head = self._tail
+    
+    def _grow(self) -> None:
+        """Double the capacity, keeping pending events in order (lock must be held)"""
+        pending = [self._buf[i & self._mask] for i in range(self._head, self._tail)]
+        capacity = len(self._buf) * 2
+        self._buf = pending + [None] * (capacity - len(pending))
+        self._mask = capacity - 1
+        self._head = 0
+        self._tail = len(pending)
+
+# Download threads push progress events here; the polling thread drains them
+progress_event_queue = ProgressRing()
+
+class DownloadSlots:
+    """
+    Counting limit on concurrent downloads
+    
+    Unlike a semaphore, the limit can be changed while downloads are running
+    or waiting: lowering it lets running downloads finish and holds back new
+    ones until the active count drops below the new limit.
+    """
+    
+    def __init__(self, limit: int):
+        self._cond = threading.Condition()
+        self._limit = max(1, limit)
+        self._active = 0
+    
+    def acquire(self) -> None:
+        """Block until a download slot is free, then take it"""
+        with self._cond:
+            while self._active >= self._limit:
+                self._cond.wait()
+            self._active += 1
+    
+    def release(self) -> None:
+        """Give back a slot taken with acquire()"""
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+    
+    def set_limit(self, limit: int) -> None:
+        """Change the number of downloads allowed at once"""
+        with self._cond:
+            self._limit = max(1, limit)
+            self._cond.notify_all()
+
+_download_slots = DownloadSlots(2)
+
+def set_max_concurrent_videos(limit: int) -> None:
+    """Set how many videos may download at once (applies to downloads not yet started)"""
+    _download_slots.set_limit(limit)
+
+def submit_download(fn, *args) -> None:
+    """Queue fn(*args) to run on the download pool once a slot is free, in submission order"""
+    _ensure_download_dispatcher()
+    _download_queue.put((fn, args))
+
+def _run_download(fn, args: tuple) -> None:
+    """Run a download on a pool worker and free its slot afterwards"""
+    try:
+        fn(*args)
+    finally:
+        _download_slots.release()
+
+def _dispatch_downloads() -> None:
+    """Background thread that starts queued downloads one by one as slots free up"""
+    while True:
+        fn, args = _download_queue.get()
+        _download_slots.acquire()
+        try:
+            future = _download_executor.submit(_run_download, fn, args)
+        except Exception as e:
+            _download_slots.release()
+            log_error("Could not start download: %s", e)
+            continue
+        future.add_done_callback(_log_download_failure)
+
+def _ensure_download_dispatcher() -> None:
+    """Start the download dispatcher thread on first use"""
+    global _dispatcher_started
+    with _dispatcher_lock:
+        if not _dispatcher_started:
+            threading.Thread(target=_dispatch_downloads, name="dl-dispatch", daemon=True).start()
+            _dispatcher_started = True
+
+def _bounded_error_update(update: Dict[str, any]) -> Dict[str, any]:
+    """Return the error event with its message cut to the last ERROR_MESSAGE_MAX characters"""
+    message = update.get("message")
+    if not isinstance(message, str) or len(message) <= ERROR_MESSAGE_MAX:
+        return update
+    # Son satırlar (yt-dlp'nin "ERROR:" satırı) en anlamlı kısım
+    return {**update, "message": message[-ERROR_MESSAGE_MAX:]}
+
+def _log_download_failure(future) -> None:
+    """Done-callback for download futures that logs unexpected exceptions"""
+    error = future.exception()
+    if error is not None:
+        log_event("Download thread error", error=error)
+
+def _ignore_arg_call(fn, _e):
+    """Call fn without the Flet event argument (used with functools.partial)"""
+    return fn()
+
 def create_app_ui(page: ft.Page) -> ft.Row:
     """
     Create the main application UI
@@ -98,7 +375,7 @@ def _initialize_ui_components(page: ft.Page, downloader: Downloader) -> Dict[str
         ),
         "info_text": ft.Text(),
         "progress_bar": ft.ProgressBar(width=400, visible=False),
-        "video_list": ft.ListView(expand=True, spacing=10, auto_scroll=True),
+        "video_list": ft.ListView(expand=True, spacing=10),
         
         # Quality settings
         "merge_video_audio_checkbox": ft.Checkbox(label="Merge video and audio", value=True),
@@ -170,8 +447,17 @@ def _initialize_ui_components(page: ft.Page, downloader: Downloader) -> Dict[str
         ], spacing=5, expand=True, auto_scroll=True),
         
         # Data storage
-        "validated_video_urls": [],
-        "video_cards_dict": {},
+        "progress_controls_by_thread": {},  # thread_id -> ft.Text line in progress_display
+        "app_ffmpeg_available": False,  # downloader's own FFmpeg, cached once it works
+        "download_batch": 0,  # bumped on Start/Reset/validation; older events are ignored
+        "total_downloads": 0,
+        "finished_count": 0,  # completed + failed downloads
+        "failed_count": 0,
+        "video_containers": [],  # card index -> the card's ft.Container
+        "validated_videos": [],  # video info dicts; cards exist for the first len(video_containers)
+        "pending_card_status": {},  # card index -> status reported before the card was built
+        "selected_urls": set(),  # kept in sync by each card's checkbox
+        "video_index_by_url": {},  # video URL -> card index
     }
     
     # Add merge info text
@@ -195,26 +481,12 @@ def _initialize_ui_components(page: ft.Page, downloader: Downloader) -> Dict[str
 
 def _create_language_dropdown(label: str, default_value: str) -> ft.Dropdown:
     """Create a language selection dropdown"""
-    # Base options for all dropdowns
-    base_options = [
-        ft.dropdown.Option("en", "English"),
-        ft.dropdown.Option("tr", "Türkçe"),
-        ft.dropdown.Option("es", "Español"),
-        ft.dropdown.Option("fr", "Français"),
-        ft.dropdown.Option("de", "Deutsch"),
-        ft.dropdown.Option("it", "Italiano"),
-        ft.dropdown.Option("pt", "Português"),
-        ft.dropdown.Option("ru", "Русский"),
-        ft.dropdown.Option("ja", "日本語"),
-        ft.dropdown.Option("ko", "한국어"),
-        ft.dropdown.Option("zh", "中文"),
-        ft.dropdown.Option("ar", "العربية"),
-        ft.dropdown.Option("hi", "हिन्दी"),
-    ]
+    # Option kontrolleri tek bir parent'a ait olabilir; her dropdown kendi örneklerini alır
+    base_options = [ft.dropdown.Option(code, name) for code, name in SUBTITLE_OPTIONS]
     
     # Add "All Available" option only for subtitle dropdowns
     if "Subtitle" in label:
-        base_options.append(ft.dropdown.Option("all", "All Available"))
+        base_options.append(ft.dropdown.Option(*SUBTITLE_ALL_OPTION))
     
     return ft.Dropdown(
         label=label,
@@ -224,6 +496,75 @@ def _create_language_dropdown(label: str, default_value: str) -> ft.Dropdown:
         width=200
     )
 
+def make_video_card(title: str, duration_str: str, best_quality: str, ext: str, file_size: str,
+                    thumbnail_url: Optional[str], selected: bool, on_select) -> ft.Card:
+    """
+    Build a compact video card; style objects are shared between cards
+    
+    A card without on_select (a video with no URL) gets a disabled checkbox.
+    """
+    # Kart durum etiketi; indirme sırasında yeniden oluşturulmaz, .value güncellenir
+    status_text = ft.Text("Ready", size=9, color="#43A047", weight=ft.FontWeight.W_500)
+    if thumbnail_url:
+        thumbnail = ft.Image(src=thumbnail_url, width=_THUMB_W, height=_THUMB_H, fit="cover", border_radius=3)
+    else:
+        thumbnail = ft.Container(
+            width=_THUMB_W,
+            height=_THUMB_H,
+            bgcolor="#23272F",
+            border_radius=3,
+            alignment=ft.alignment.center,
+            content=ft.Text("📹", size=14)
+        )
+    return ft.Card(
+        content=ft.Container(
+            data={"status_text": status_text},
+            bgcolor="#181A20",
+            border_radius=6,
+            padding=6,
+            content=ft.Row([
+                # Thumbnail - daha küçük
+                ft.Container(content=thumbnail, margin=_THUMB_MARGIN),
+                # Video info - daha kompakt
+                ft.Column([
+                    ft.Text(
+                        title,
+                        size=12,
+                        weight=ft.FontWeight.W_600,
+                        max_lines=1,
+                        overflow=ft.TextOverflow.ELLIPSIS,
+                        color="#F1F1F1"
+                    ),
+                    ft.Row([
+                        ft.Text(duration_str, size=10, color="#A0A0A0"),
+                        ft.Text("|", **_SEP_STYLE),
+                        ft.Text(best_quality, size=10, color="#4FC3F7"),
+                        ft.Text("|", **_SEP_STYLE),
+                        ft.Text(ext, size=10, color="#BA68C8"),
+                        ft.Text("|", **_SEP_STYLE),
+                        ft.Text(file_size, size=10, color="#26A69A"),
+                    ], spacing=3),
+                    ft.Container(
+                        content=status_text,
+                        bgcolor="#263238",
+                        border_radius=3,
+                        padding=_BADGE_PADDING,
+                        margin=_BADGE_MARGIN
+                    )
+                ], expand=True, alignment=ft.MainAxisAlignment.START, spacing=2),
+                # Download checkbox - daha küçük
+                ft.Container(
+                    content=ft.Checkbox(label="", value=selected, scale=0.7, on_change=on_select,
+                                        disabled=on_select is None),
+                    alignment=ft.alignment.center_right,
+                    expand=False,
+                    margin=_CHECKBOX_MARGIN
+                ),
+            ], expand=True),
+        ),
+        margin=_CARD_MARGIN
+    )
+
 def _create_main_section(components: Dict[str, ft.Control]) -> ft.Column:
     """Create the main input section"""
     return ft.Column([
@@ -238,7 +579,7 @@ def _create_main_section(components: Dict[str, ft.Control]) -> ft.Column:
             components["clear_archive_button"], 
             components["check_issues_button"]
         ], alignment=ft.MainAxisAlignment.CENTER),
-    ], spacing=UI_CONFIG["spacing"])
+    ], spacing=_SPACING)
 
 def _create_settings_section(components: Dict[str, ft.Control]) -> ft.Column:
     """Create the settings section"""
@@ -278,9 +619,9 @@ def _create_videos_section(components: Dict[str, ft.Control]) -> ft.Column:
         ),
         ft.Container(
             content=components["progress_display"],
-            height=UI_CONFIG["progress_height"],
+            height=_PROGRESS_H,
             expand=True,
-            border=ft.border.all(1, UI_CONFIG["colors"]["border"]),
+            border=ft.border.all(1, _BORDER_COLOR),
             border_radius=6,
             padding=10,
             bgcolor="#1A1A1A",
@@ -291,8 +632,8 @@ def _on_folder_selected(e: ft.FilePickerResultEvent, components: Dict[str, ft.Co
     """Handles the result of the folder selection dialog."""
     if e.path:
         components["download_path_text"].value = e.path
-        page.update()
-        log_event(f"user_action: selected_download_path, path={e.path}")
+        components["download_path_text"].update()
+        log_event("user_action: selected_download_path", path=e.path)
 
 def _on_cookies_selected(e: ft.FilePickerResultEvent, components: Dict[str, ft.Control], downloader: Downloader, page: ft.Page):
     """Handles the result of the cookies file selection dialog."""
@@ -300,48 +641,65 @@ def _on_cookies_selected(e: ft.FilePickerResultEvent, components: Dict[str, ft.C
         cookies_file = e.files[0].path
         components["cookies_path_text"].value = cookies_file
         downloader.set_cookies_file(cookies_file)
-        page.update()
-        log_event(f"user_action: selected_cookies_file, file={cookies_file}")
+        components["cookies_path_text"].update()
+        log_event("user_action: selected_cookies_file", file=cookies_file)
 
 def extract_cookies_from_browser(components: Dict[str, ft.Control], downloader: Downloader, page: ft.Page):
-    """Extract cookies from browser"""
+    """Extract cookies from browser without blocking the UI thread"""
+    progress_was_visible = components["progress_bar"].visible
     components["info_text"].value = "Cookies are being extracted from the browser..."
     components["info_text"].color = "blue"
+    components["progress_bar"].visible = True
+    components["extract_cookies_button"].disabled = True
     page.update()
-    log_event(f"user_action: extracted_cookies_from_browser")
-    
+    log_event("user_action: extracted_cookies_from_browser")
+    threading.Thread(
+        target=_extract_cookies_thread,
+        args=(components, downloader, page, progress_was_visible),
+        daemon=True,
+    ).start()
+
+def _extract_cookies_thread(components: Dict[str, ft.Control], downloader: Downloader, page: ft.Page,
+                            progress_was_visible: bool) -> None:
+    """Run the cookie extractor script and report the result on the UI thread"""
+    cookies_file = None
     try:
         # Run cookie extractor script
-        script_path = os.path.join(os.path.dirname(__file__), "cookie_extractor.py")
-        result = subprocess.run([sys.executable, script_path, "--browser", "auto"], capture_output=True, text=True, timeout=30)
+        result = subprocess.run([sys.executable, COOKIE_EXTRACTOR_SCRIPT, "--browser", "auto"], capture_output=True, text=True, timeout=30)
         
         if result.returncode == 0:
             # If successful, automatically select cookies file
-            cookies_file = os.path.join(os.path.dirname(__file__), "youtube_cookies.txt")
-            if os.path.exists(cookies_file):
-                components["cookies_path_text"].value = cookies_file
-                downloader.set_cookies_file(cookies_file)
-                components["info_text"].value = "Cookies successfully extracted and selected!"
-                components["info_text"].color = "green"
-                log_event(f"user_action: cookies_extracted_and_selected, file={cookies_file}")
+            if os.path.exists(DEFAULT_COOKIES_FILE):
+                cookies_file = DEFAULT_COOKIES_FILE
+                message, color = "Cookies successfully extracted and selected!", "green"
+                log_event("user_action: cookies_extracted_and_selected", file=cookies_file)
             else:
-                components["info_text"].value = "Cookies extracted but file not found."
-                components["info_text"].color = "orange"
-                log_event(f"user_action: cookies_extracted_but_file_not_found, file={cookies_file}")
+                message, color = "Cookies extracted but file not found.", "orange"
+                log_event("user_action: cookies_extracted_but_file_not_found", file=DEFAULT_COOKIES_FILE)
         else:
-            components["info_text"].value = f"Cookies extraction error: {result.stderr}"
-            components["info_text"].color = "red"
-            log_event(f"user_action: cookies_extraction_failed, error={result.stderr}")
+            message, color = f"Cookies extraction error: {result.stderr}", "red"
+            log_event("user_action: cookies_extraction_failed", error=result.stderr)
             
     except subprocess.TimeoutExpired:
-        components["info_text"].value = "Cookies extraction timed out."
-        components["info_text"].color = "red"
-        log_event(f"user_action: cookies_extraction_timed_out")
+        message, color = "Cookies extraction timed out.", "red"
+        log_event("user_action: cookies_extraction_timed_out")
     except Exception as e:
-        components["info_text"].value = f"Cookies extraction error: {str(e)}"
-        components["info_text"].color = "red"
-        log_event(f"user_action: cookies_extraction_error, error={str(e)}")
+        message, color = f"Cookies extraction error: {str(e)}", "red"
+        log_event("user_action: cookies_extraction_error", error=e)
     
+    page.run_thread(_finish_cookie_extraction, components, downloader, page, message, color, cookies_file, progress_was_visible)
+
+def _finish_cookie_extraction(components: Dict[str, ft.Control], downloader: Downloader, page: ft.Page,
+                              message: str, color: str, cookies_file: Optional[str], progress_was_visible: bool) -> None:
+    """Show the cookie extraction result and select the extracted file"""
+    if cookies_file:
+        components["cookies_path_text"].value = cookies_file
+        downloader.set_cookies_file(cookies_file)
+    components["info_text"].value = message
+    components["info_text"].color = color
+    # İndirme sürerken progress bar açık kalmalı
+    components["progress_bar"].visible = progress_was_visible
+    components["extract_cookies_button"].disabled = False
     page.update()
 
 def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloader, page: ft.Page):
@@ -363,36 +721,42 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
             return f"{minutes:02d}:{secs:02d}"
     
     # File Picker button events
-    components["select_path_button"].on_click = lambda _: components["file_picker"].get_directory_path()
-    components["select_cookies_button"].on_click = lambda _: components["cookies_picker"].pick_files(allowed_extensions=["txt"], allow_multiple=False)
-    components["extract_cookies_button"].on_click = lambda _: extract_cookies_from_browser(components, downloader, page)
+    components["select_path_button"].on_click = partial(_ignore_arg_call, components["file_picker"].get_directory_path)
+    components["select_cookies_button"].on_click = partial(
+        _ignore_arg_call,
+        partial(components["cookies_picker"].pick_files, allowed_extensions=["txt"], allow_multiple=False)
+    )
+    components["extract_cookies_button"].on_click = partial(
+        _ignore_arg_call,
+        partial(extract_cookies_from_browser, components, downloader, page)
+    )
     
     # Subtitle checkbox events for enabling/disabling dropdowns
-    def on_subtitle_change(e):
-        components["subtitle_language_dropdown"].disabled = not components["subtitle_checkbox"].value
+    def apply_subtitle_state():
+        subtitles = components["subtitle_checkbox"].value
+        auto_subtitles = components["auto_subtitle_checkbox"].value
+        components["subtitle_language_dropdown"].disabled = not subtitles
+        components["auto_translate_language_dropdown"].disabled = not auto_subtitles
         # Embed subtitles sadece altyazı indirme aktifken kullanılabilir
-        if not components["subtitle_checkbox"].value and not components["auto_subtitle_checkbox"].value:
-            components["embed_subtitles_checkbox"].disabled = True
-        else:
-            components["embed_subtitles_checkbox"].disabled = False
-        page.update()
+        components["embed_subtitles_checkbox"].disabled = not (subtitles or auto_subtitles)
     
-    def on_auto_subtitle_change(e):
-        components["auto_translate_language_dropdown"].disabled = not components["auto_subtitle_checkbox"].value
-        # Embed subtitles sadece altyazı indirme aktifken kullanılabilir
-        if not components["subtitle_checkbox"].value and not components["auto_subtitle_checkbox"].value:
-            components["embed_subtitles_checkbox"].disabled = True
-        else:
-            components["embed_subtitles_checkbox"].disabled = False
-        page.update()
+    def refresh_subtitle_state(e):
+        apply_subtitle_state()
+        components["subtitle_language_dropdown"].update()
+        components["auto_translate_language_dropdown"].update()
+        components["embed_subtitles_checkbox"].update()
     
-    components["subtitle_checkbox"].on_change = on_subtitle_change
-    components["auto_subtitle_checkbox"].on_change = on_auto_subtitle_change
+    components["subtitle_checkbox"].on_change = refresh_subtitle_state
+    components["auto_subtitle_checkbox"].on_change = refresh_subtitle_state
+    
+    def on_concurrent_videos_change(e):
+        set_max_concurrent_videos(int(e.control.value))
+    
+    components["concurrent_videos_slider"].on_change = on_concurrent_videos_change
+    set_max_concurrent_videos(int(components["concurrent_videos_slider"].value))
     
     # Başlangıçta durumları ayarla
-    components["subtitle_language_dropdown"].disabled = not components["subtitle_checkbox"].value
-    components["auto_translate_language_dropdown"].disabled = not components["auto_subtitle_checkbox"].value
-    components["embed_subtitles_checkbox"].disabled = not (components["subtitle_checkbox"].value or components["auto_subtitle_checkbox"].value)
+    apply_subtitle_state()
 
     # --- Download Progress Table ---
     # This section is no longer needed as progress is displayed in the ListView
@@ -446,12 +810,11 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
     
     # --- Global video URL listesi ---
     # This section is no longer needed as video list is managed by the downloader
-    # validated_video_urls = []
     # video_cards_dict = {}  # Video kartlarını takip etmek için
 
     def reset_application():
         """Uygulamayı yeni indirme için sıfırlar"""
-        global download_counter
+        global _download_counter
         
         # URL input'u temizle
         components["url_input"].value = ""
@@ -469,6 +832,12 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
         
         # Progress display'i temizle
         components["progress_display"].controls.clear()
+        components["progress_controls_by_thread"].clear()
+        # Hâlâ süren eski indirmelerin event'leri yeni kartlara/sayaçlara dokunmasın
+        components["download_batch"] += 1
+        components["total_downloads"] = 0
+        components["finished_count"] = 0
+        components["failed_count"] = 0
         components["progress_display"].controls.append(
             ft.Text("No downloads yet. Progress will appear here when you start downloading.", 
                     size=12, 
@@ -477,20 +846,19 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
         )
         
         # Local değişkenleri sıfırla
-        components["validated_video_urls"].clear()
-        components["video_cards_dict"].clear()
-        download_counter = 0
+        components["video_containers"].clear()
+        components["video_index_by_url"].clear()
+        components["validated_videos"] = []
+        components["pending_card_status"].clear()
+        components["selected_urls"].clear()
+        _download_counter = count(1)
         
         # Butonları aktif et
         components["validate_button"].disabled = False
         components["download_button"].disabled = True
         
         # Progress event queue'yu temizle
-        while not progress_event_queue.empty():
-            try:
-                progress_event_queue.get_nowait()
-            except queue.Empty:
-                break
+        progress_event_queue.clear()
         
         page.update()
         log_event("user_action: application_reset")
@@ -502,7 +870,7 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
             components["info_text"].value = "Please enter a URL."
             components["info_text"].color = "red"
             page.update()
-            log_event(f"user_action: validate_url_clicked, url={url}")
+            log_event("user_action: validate_url_clicked", url=url)
             return
         components["info_text"].value = "Validating URL, please wait..."
         components["info_text"].color = None
@@ -511,18 +879,91 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
         components["validate_button"].disabled = True
         components["download_button"].disabled = True
         page.update()
-        log_event(f"user_action: validate_url_clicked, url={url}")
+        log_event("user_action: validate_url_clicked", url=url)
         threading.Thread(target=validate_url_thread, args=(url,)).start()
 
     def validate_url_thread(url):
         videos, error = downloader.get_video_info(url)
         page.run_thread(lambda: update_ui_after_validation(videos, error))
 
+    def video_url_of(video):
+        """Return the URL used to download a validated video, or None"""
+        if 'webpage_url' in video:
+            return video['webpage_url']
+        return video.get('url')
+
+    def on_video_checkbox_change(video_url, e):
+        if e.control.value:
+            components["selected_urls"].add(video_url)
+        else:
+            components["selected_urls"].discard(video_url)
+
+    def build_video_card(video):
+        """Build the compact card control for a validated video"""
+        video_url = video_url_of(video)
+        thumbnail_url = video.get('thumbnail')
+        title = video.get('title', 'No Title')
+        duration = video.get('duration', 0)
+        duration_str = format_duration(duration) if duration else "Unknown"
+        formats = video.get('formats', [])
+        best_quality = "-"
+        best_format = None
+        file_size = "-"
+        vcodec = "-"
+        acodec = "-"
+        ext = "-"
+        def safe_val(val):
+            return val if val and val not in ["Unknown", "none"] else "-"
+        if formats:
+            video_formats = [f for f in formats if f.get('vcodec') != 'none' and f.get('height')]
+            if video_formats:
+                best_format = max(video_formats, key=lambda x: (x.get('height', 0), x.get('fps', 0), x.get('tbr', 0)))
+                best_quality = f"{safe_val(best_format.get('height', '-'))}p"
+                filesize = best_format.get('filesize', 0) or best_format.get('filesize_approx', 0)
+                if filesize:
+                    file_size = f"{round(filesize/1024/1024, 2)} MB"
+                vcodec = safe_val(best_format.get('vcodec', '-'))
+                acodec = safe_val(best_format.get('acodec', '-'))
+                ext = safe_val(best_format.get('ext', '-'))
+        return make_video_card(
+            title, duration_str, best_quality, ext, file_size, thumbnail_url,
+            selected=video_url in components["selected_urls"],
+            # URL'si olmayan video indirilemez; seçim kutusu devre dışı
+            on_select=partial(on_video_checkbox_change, video_url) if video_url is not None else None,
+        )
+
+    def append_video_cards():
+        """Build the next page of video cards and add them to the video list"""
+        video_containers = components["video_containers"]
+        start = len(video_containers)
+        for index, video in enumerate(components["validated_videos"][start:start + VIDEO_CARD_PAGE_SIZE], start):
+            video_card = build_video_card(video)
+            components["video_list"].controls.append(video_card)
+            video_containers.append(video_card.content)
+            # Kart oluşturulmadan önce biten indirmelerin durumunu uygula
+            status = components["pending_card_status"].pop(index, None)
+            if status:
+                update_video_card_status(index, status, components)
+
+    def on_video_list_scroll(e):
+        if len(components["video_containers"]) >= len(components["validated_videos"]):
+            return
+        if e.pixels >= e.max_scroll_extent - VIDEO_LIST_LOAD_MARGIN:
+            append_video_cards()
+            components["video_list"].update()
+
+    components["video_list"].on_scroll = on_video_list_scroll
+
     def update_ui_after_validation(videos, error):
         components["progress_bar"].visible = False
         components["validate_button"].disabled = False
-        components["validated_video_urls"].clear()
-        components["video_cards_dict"].clear()  # Video kartları sözlüğünü temizle
+        components["video_containers"].clear()  # Video kartlarını temizle
+        components["video_index_by_url"].clear()
+        components["validated_videos"] = []
+        components["pending_card_status"].clear()
+        components["selected_urls"].clear()
+        # Kart index'leri değişti; önceki indirmelerin event'leri artık geçersiz
+        components["download_batch"] += 1
         if error:
             if "fragment 1 not found" in error or "unable to continue" in error:
                 components["info_text"].value = (
@@ -531,122 +972,36 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
                 )
                 components["info_text"].color = "red"
                 page.update()
-                log_event(f"download_error: validation_failed, error={error}")
+                log_event("download_error: validation_failed", error=error)
                 return
             components["info_text"].value = f"Error: {error.strip().splitlines()[-1]}"
             components["info_text"].color = "red"
             page.update()
-            log_event(f"download_error: validation_failed, error={error}")
+            log_event("download_error: validation_failed", error=error)
             return
         if not videos:
             components["info_text"].value = "No videos found at this URL."
             page.update()
-            log_event(f"download_info: no_videos_found, url={components['url_input'].value}")
+            log_event("download_info: no_videos_found", url=components["url_input"].value)
             return
         components["info_text"].value = f"Found {len(videos)} videos. Ready to download."
         components["download_button"].disabled = False
         components["video_list"].controls.clear()
-        for video in videos:
+        for index, video in enumerate(videos):
             # Her video için URL'yi topla
-            video_url = None
-            if 'webpage_url' in video:
-                video_url = video['webpage_url']
-                components["validated_video_urls"].append(video_url)
-            elif 'url' in video:
-                video_url = video['url']
-                components["validated_video_urls"].append(video_url)
-            thumbnail_url = video.get('thumbnail')
-            title = video.get('title', 'No Title')
-            duration = video.get('duration', 0)
-            duration_str = format_duration(duration) if duration else "Unknown"
-            formats = video.get('formats', [])
-            best_quality = "-"
-            best_format = None
-            file_size = "-"
-            vcodec = "-"
-            acodec = "-"
-            ext = "-"
-            def safe_val(val):
-                return val if val and val not in ["Unknown", "none"] else "-"
-            if formats:
-                video_formats = [f for f in formats if f.get('vcodec') != 'none' and f.get('height')]
-                if video_formats:
-                    best_format = max(video_formats, key=lambda x: (x.get('height', 0), x.get('fps', 0), x.get('tbr', 0)))
-                    best_quality = f"{safe_val(best_format.get('height', '-'))}p"
-                    filesize = best_format.get('filesize', 0) or best_format.get('filesize_approx', 0)
-                    if filesize:
-                        file_size = f"{round(filesize/1024/1024, 2)} MB"
-                    vcodec = safe_val(best_format.get('vcodec', '-'))
-                    acodec = safe_val(best_format.get('acodec', '-'))
-                    ext = safe_val(best_format.get('ext', '-'))
-            # Kompakt video kartı UI
-            video_card = ft.Card(
-                content=ft.Container(
-                    bgcolor="#181A20",
-                    border_radius=6,
-                    padding=6,
-                    content=ft.Row([
-                            # Thumbnail - daha küçük
-                            ft.Container(
-                                content=ft.Image(
-                                    src=thumbnail_url, 
-                                width=60,
-                                height=34,
-                                    fit="cover", 
-                                    border_radius=3
-                                ) if thumbnail_url else ft.Container(
-                                width=60,
-                                height=34,
-                                bgcolor="#23272F",
-                                border_radius=3,
-                                alignment=ft.alignment.center,
-                                content=ft.Text("📹", size=14)
-                                ),
-                                margin=ft.margin.only(right=8)
-                            ),
-                        # Video info - daha kompakt
-                            ft.Column([
-                                ft.Text(
-                                    title, 
-                                size=12,
-                                weight=ft.FontWeight.W_600,
-                                    max_lines=1,
-                                overflow=ft.TextOverflow.ELLIPSIS,
-                                color="#F1F1F1"
-                                ),
-                            ft.Row([
-                                ft.Text(duration_str, size=10, color="#A0A0A0"),
-                                ft.Text("|", size=10, color="#444"),
-                                ft.Text(best_quality, size=10, color="#4FC3F7"),
-                                ft.Text("|", size=10, color="#444"),
-                                ft.Text(ext, size=10, color="#BA68C8"),
-                                ft.Text("|", size=10, color="#444"),
-                                ft.Text(file_size, size=10, color="#26A69A"),
-                            ], spacing=3),
-                            ft.Container(
-                                content=ft.Text("Ready", size=9, color="#43A047", weight=ft.FontWeight.W_500),
-                                bgcolor="#263238",
-                                border_radius=3,
-                                padding=ft.padding.symmetric(horizontal=4, vertical=1),
-                                margin=ft.margin.only(top=1)
-                            )
-                            ], expand=True, alignment=ft.MainAxisAlignment.START, spacing=2),
-                        # Download checkbox - daha küçük
-                        ft.Container(
-                            content=ft.Checkbox(label="", value=True, scale=0.7),
-                            alignment=ft.alignment.center_right,
-                            expand=False,
-                            margin=ft.margin.only(left=6)
-                        ),
-                        ], expand=True),
-                ),
-                margin=ft.margin.only(bottom=4)
-            )
-            components["video_list"].controls.append(video_card)
-            components["video_cards_dict"][video_url] = video_card # Kartı sözlüğe ekle
+            video_url = video_url_of(video)
+            if video_url is not None:
+                # Progress event'leri URL yerine kart index'ini taşır
+                components["video_index_by_url"][video_url] = index
+                # Tüm videolar varsayılan olarak seçili
+                components["selected_urls"].add(video_url)
+        
+        # Kartları sayfa sayfa oluştur; büyük listelerde geri kalanı kaydırdıkça eklenir
+        components["validated_videos"] = videos
+        append_video_cards()
         
         page.update()
-        log_event(f"download_info: validation_successful, url={components['url_input'].value}, num_videos={len(videos)}")
+        log_event("download_info: validation_successful", url=components["url_input"].value, num_videos=len(videos))
 
     def start_download_click(e):
         url = components["url_input"].value
@@ -654,14 +1009,21 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
             components["info_text"].value = "Please enter a URL to download."
             components["info_text"].color = "red"
             page.update()
-            log_event(f"user_action: start_download_clicked, url={url}")
+            log_event("user_action: start_download_clicked", url=url)
             return
         download_path = components["download_path_text"].value
         if not download_path:
             components["info_text"].value = "Please select a download path."
             components["info_text"].color = "red"
             page.update()
-            log_event(f"user_action: start_download_clicked, url={url}, download_path={download_path}")
+            log_event("user_action: start_download_clicked", url=url, download_path=download_path)
+            return
+        video_index_by_url = components["video_index_by_url"]
+        if video_index_by_url and not components["selected_urls"]:
+            components["info_text"].value = "Please select at least one video to download."
+            components["info_text"].color = "red"
+            components["info_text"].update()
+            log_event("user_action: start_download_clicked", url=url, selected=0)
             return
             
         # Archive dosyası kontrolü
@@ -683,15 +1045,22 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
         
         # Progress display'i temizle ve başlangıç mesajı ekle
         components["progress_display"].controls.clear()
+        components["progress_controls_by_thread"].clear()
         components["progress_display"].controls.append(
             ft.Text("Preparing downloads...", size=12, color="#4FC3F7", italic=True)
         )
         
         # Her video için ayrı thread başlat - ThreadPoolExecutor ile kontrollü
-        urls_to_download = components["validated_video_urls"] if components["validated_video_urls"] else [url]
+        # Seçili videolar kart sırasıyla indirilir
+        urls_to_download = sorted(components["selected_urls"], key=video_index_by_url.__getitem__) or [url]
         
         # İndirme bilgisi ekle
         total_videos = len(urls_to_download)
+        components["download_batch"] += 1
+        batch = components["download_batch"]
+        components["total_downloads"] = total_videos
+        components["finished_count"] = 0
+        components["failed_count"] = 0
         max_concurrent = int(components["concurrent_videos_slider"].value)
         components["progress_display"].controls.append(
             ft.Text(f"📊 Total videos: {total_videos} | Max concurrent: {max_concurrent}", 
@@ -699,7 +1068,7 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
         )
         page.update()
         
-        log_event(f"user_action: start_download_clicked, url={url}, download_path={download_path}")
+        log_event("user_action: start_download_clicked", url=url, download_path=download_path)
         download_options = {
             "quality": "bestvideo+bestaudio/best",
             "merge_video_audio": components["merge_video_audio_checkbox"].value,
@@ -711,57 +1080,49 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
             "concurrent_fragments": int(components["concurrent_downloads_slider"].value),
         }
         
-        # Aynı anda indirme sayısını al
-        max_concurrent_videos = int(components["concurrent_videos_slider"].value)
-        
-        def start_concurrent_downloads():
-            with ThreadPoolExecutor(max_workers=max_concurrent_videos) as executor:
-                futures = []
-                for video_url in urls_to_download:
-                    future = executor.submit(download_single_video_wrapper, video_url, download_options.copy(), download_path)
-                    futures.append(future)
-                    time.sleep(0.5)  # Videolar arasında kısa bekleme
-                
-                # Tüm indirmelerin tamamlanmasını bekle
-                for future in futures:
-                    try:
-                        future.result()
-                    except Exception as e:
-                        log_event(f"Download thread error: {e}")
-        
-        # Concurrent downloads'ı ayrı thread'de başlat
-        threading.Thread(target=start_concurrent_downloads, daemon=True).start()
-
-    def download_single_video_wrapper(video_url, download_options, download_path):
-        """ThreadPoolExecutor için wrapper fonksiyon"""
-        global download_counter
-        download_counter += 1
-        thread_id = f"download_{download_counter}"
-        download_options["thread_id"] = thread_id
-        download_options["video_url"] = video_url  # URL'yi de ekle
+        # Tüm videoları sırayla kuyruğa ekle; aynı anda kaç tanesinin ineceğini slot limiti belirler
+        for video_url in urls_to_download:
+            card_index = video_index_by_url.get(video_url)
+            submit_download(download_single_video_wrapper, batch, video_url, download_options, download_path, card_index)
+
+    def download_single_video_wrapper(batch, video_url, base_options, download_path, card_index=None):
+        """Download one video on a pool worker (its slot is held by submit_download)"""
+        # Aynı anda başlayan indirmeler YouTube'a tek seferde istek atmasın
+        time.sleep(random.uniform(0, DOWNLOAD_START_JITTER))
+        thread_id = f"download_{next(_download_counter)}"
+        # base_options tüm videolar arasında paylaşılır; bu indirmeye özel kopya
+        download_options = {**base_options, "thread_id": thread_id, "video_url": video_url}
         
-        print(f"[DEBUG] Starting download wrapper for: {video_url}")
-        log_event(f"download_wrapper_start: thread_id={thread_id}, url={video_url}")
+        log_event("download_wrapper_start", thread_id=thread_id, url=video_url)
         
         try:
+            last_progress_emit = 0.0
             for update in downloader.download_videos([video_url], download_options, download_path):
-                update["video_url"] = video_url  # Her update'e URL ekle
-                print(f"[DEBUG] Wrapper sending update: {update}")
-                progress_event_queue.put(update)
-            print(f"[DEBUG] Download wrapper completed for: {video_url}")
-            log_event(f"download_wrapper_end: thread_id={thread_id}, url={video_url}")
+                if update.get("type") != "progress":
+                    if update.get("type") == "error":
+                        update = _bounded_error_update(update)
+                    progress_event_queue.put(ProgressUpdate(batch, video_url, card_index, update))
+                    continue
+                # Progress event'lerini UI flush aralığından sık gönderme; bitiş (%100) her zaman gider
+                if update.get("percent", 0) < 100:
+                    now = time.monotonic()
+                    if now - last_progress_emit < PROGRESS_FLUSH_INTERVAL:
+                        continue
+                    last_progress_emit = now
+                # Satır metni UI thread'i yerine burada bir kez oluşturulur
+                row = ProgressRow.from_update(update)
+                progress_event_queue.put(ProgressUpdate(batch, video_url, card_index, update, row, row.progress_line()))
+            log_event("download_wrapper_end", thread_id=thread_id, url=video_url)
         except Exception as e:
-            print(f"[DEBUG] Download wrapper error for {video_url}: {e}")
-            log_event(f"download_wrapper_error: thread_id={thread_id}, url={video_url}, error={e}")
+            log_event("download_wrapper_error", thread_id=thread_id, url=video_url, error=e)
             # Hata durumunda error eventi gönder
             error_update = {
                 "type": "error",
-                "message": str(e),
+                "message": str(e)[-ERROR_MESSAGE_MAX:],
                 "thread_id": thread_id,
-                "video_url": video_url,
                 "title": "Unknown"
             }
-            progress_event_queue.put(error_update)
+            progress_event_queue.put(ProgressUpdate(batch, video_url, card_index, error_update))
 
     # Progress polling is handled by _start_progress_monitoring function
     # No need for duplicate polling here
@@ -773,9 +1134,7 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
     # Button event handlers
     components["validate_button"].on_click = validate_url_click
     components["download_button"].on_click = start_download_click
-    components["reset_button"].on_click = lambda _: reset_application()
-    components["clear_archive_button"].on_click = lambda _: clear_download_archive()
-    components["check_issues_button"].on_click = lambda _: check_download_issues()
+    components["reset_button"].on_click = partial(_ignore_arg_call, reset_application)
     
     # Additional utility functions
     def clear_download_archive():
@@ -795,91 +1154,118 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
         except Exception as e:
             components["info_text"].value = f"Error clearing archive: {e}"
             components["info_text"].color = "red"
-            log_event(f"user_action: archive_clear_error, error={e}")
+            log_event("user_action: archive_clear_error", error=e)
             page.update()
     
     def check_download_issues():
+        """Start the system status checks without blocking the UI thread"""
+        components["info_text"].value = "Checking for download issues..."
+        components["info_text"].color = "blue"
+        # Kontroller bitene kadar tekrar tıklanıp paralel kontrol başlatılmasın
+        components["check_issues_button"].disabled = True
+        page.update()
+        threading.Thread(target=check_download_issues_thread, daemon=True).start()
+
+    def check_download_issues_thread():
         """Check for download issues and system status"""
-        from utils import check_yt_dlp, check_ffmpeg, get_disk_space
-        
-        issues = []
+        # Kullanıcı yt-dlp/FFmpeg'i sonradan kurmuş olabilir; yalnızca başarısız sonuçlar yeniden denenir
+        refresh_tool_checks()
         
         # 1. Check yt-dlp version
-        try:
-            result = subprocess.run(["yt-dlp", "--version"], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                issues.append(f"✅ yt-dlp version: {version}")
-            else:
-                issues.append("❌ yt-dlp not working properly")
-        except Exception as e:
-            issues.append(f"❌ yt-dlp error: {e}")
+        def check_ytdlp_version():
+            try:
+                version = get_yt_dlp_version()
+                if version:
+                    return [f"✅ yt-dlp version: {version}"]
+                return ["❌ yt-dlp not working properly"]
+            except Exception as e:
+                return [f"❌ yt-dlp error: {e}"]
         
         # 2. Check internet connection
-        try:
-            result = subprocess.run(["ping", "youtube.com", "-n", "1"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                issues.append("✅ Internet connection: OK")
-            else:
-                issues.append("❌ Internet connection: Failed")
-        except Exception:
-            issues.append("❌ Internet connection: Cannot test")
+        def check_connection():
+            try:
+                with socket.create_connection(("youtube.com", 443), timeout=2):
+                    return ["✅ Internet connection: OK"]
+            except OSError as e:
+                return [f"❌ Internet connection: {e}"]
         
         # 3. Check disk space
-        download_path = components["download_path_text"].value or "."
-        disk_info = get_disk_space(download_path)
-        if disk_info:
-            free_gb = disk_info["free"]
+        def check_disk_space():
+            download_path = components["download_path_text"].value or "."
+            try:
+                free_gb = shutil.disk_usage(os.path.abspath(download_path)).free / GIB
+            except OSError as e:
+                return [f"❌ Disk space check failed: {e}"]
             if free_gb > 1:
-                issues.append(f"✅ Disk space: {free_gb:.1f} GB available")
-            else:
-                issues.append(f"⚠️ Disk space: Only {free_gb:.1f} GB available")
-        else:
-            issues.append("❌ Disk space check failed")
+                return [f"✅ Disk space: {free_gb:.1f} GB available"]
+            return [f"⚠️ Disk space: Only {free_gb:.1f} GB available"]
         
         # 4. Check FFmpeg
-        if downloader.check_ffmpeg():
-            issues.append("✅ FFmpeg: Available")
-        else:
-            issues.append("❌ FFmpeg: Not available (video merging may fail)")
+        def check_ffmpeg_status():
+            if check_ffmpeg():
+                return ["✅ FFmpeg: Available"]
+            # Sistem FFmpeg'i yoksa downloader'ın kendi FFmpeg'ine bak; başarılı sonuç oturum boyunca saklanır
+            if not components["app_ffmpeg_available"]:
+                components["app_ffmpeg_available"] = downloader.check_ffmpeg()
+            if components["app_ffmpeg_available"]:
+                return ["✅ FFmpeg: Available"]
+            return ["❌ FFmpeg: Not available (video merging may fail)"]
         
         # 5. Check cookies
-        if downloader.cookies_file and os.path.exists(downloader.cookies_file):
-            issues.append("✅ Cookies: Available")
-        else:
-            issues.append("⚠️ Cookies: Not set (member-only videos may fail)")
+        def check_cookies():
+            if downloader.cookies_file and os.path.exists(downloader.cookies_file):
+                return ["✅ Cookies: Available"]
+            return ["⚠️ Cookies: Not set (member-only videos may fail)"]
         
         # 6. Check archive file
-        if os.path.exists(downloader.archive_path):
-            with open(downloader.archive_path, 'r', encoding='utf-8') as f:
-                archive_lines = len(f.readlines())
-            issues.append(f"⚠️ Archive: {archive_lines} videos already downloaded")
-        else:
-            issues.append("✅ Archive: Clean")
+        def check_archive():
+            try:
+                if os.path.exists(downloader.archive_path):
+                    archive_lines = count_lines(downloader.archive_path)
+                    return [f"⚠️ Archive: {archive_lines} videos already downloaded"]
+                return ["✅ Archive: Clean"]
+            except OSError as e:
+                return [f"❌ Archive check failed: {e}"]
         
         # 7. Check log file for recent errors
-        try:
-            if os.path.exists("app_log.txt"):
-                with open("app_log.txt", 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    recent_errors = [line for line in lines[-50:] if "DETAILED_ERROR" in line]
+        def check_log():
+            try:
+                if os.path.exists(LOG_FILE):
+                    recent_errors = [line for line in tail_lines(LOG_FILE, max_bytes=16384, n=50) if "DETAILED_ERROR" in line]
                     if recent_errors:
-                        issues.append(f"❌ Recent errors: {len(recent_errors)} found in log")
                         last_error = recent_errors[-1].strip()
-                        issues.append(f"   Last error: {last_error[-100:]}")
-                    else:
-                        issues.append("✅ No recent errors in log")
-            else:
-                issues.append("⚠️ No log file found")
-        except Exception as e:
-            issues.append(f"❌ Log check failed: {e}")
+                        return [
+                            f"❌ Recent errors: {len(recent_errors)} found in log",
+                            f"   Last error: {last_error[-100:]}",
+                        ]
+                    return ["✅ No recent errors in log"]
+                return ["⚠️ No log file found"]
+            except Exception as e:
+                return [f"❌ Log check failed: {e}"]
+        
+        checks = [
+            check_ytdlp_version, check_connection, check_disk_space, check_ffmpeg_status,
+            check_cookies, check_archive, check_log,
+        ]
+        # Kontroller birbirinden bağımsız; hepsi aynı anda çalışır, sonuçlar sabit sırada gösterilir
+        issues = []
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            for result in executor.map(lambda check: check(), checks):
+                issues.extend(result)
         
+        page.run_thread(show_download_issues, issues)
+    
+    def show_download_issues(issues):
         # Display results
         components["info_text"].value = "\n".join(issues)
         components["info_text"].color = "blue"
+        components["check_issues_button"].disabled = False
         page.update()
         log_event("user_action: download_issues_checked")
 
+    components["clear_archive_button"].on_click = partial(_ignore_arg_call, clear_download_archive)
+    components["check_issues_button"].on_click = partial(_ignore_arg_call, check_download_issues)
+
     # --- Layout ---
     # settings_column = ft.Column([
     #     ft.Text("Download Settings", size=16, weight=ft.FontWeight.BOLD),
@@ -937,193 +1323,249 @@ def _setup_event_handlers(components: Dict[str, ft.Control], downloader: Downloa
     #     ),
     # ], expand=True)
 
-def _start_progress_monitoring(components: Dict[str, ft.Control], page: ft.Page) -> None:
-    """Start progress monitoring thread for download updates"""
+def _start_progress_monitoring(components: Dict[str, ft.Control], page: ft.Page) -> threading.Event:
+    """
+    Start progress monitoring thread for download updates
+    
+    Returns:
+        threading.Event: Set it (and wake the queue) to stop the thread; this
+        happens automatically when the session closes
+    """
+    stop = threading.Event()
+    
     def poll_progress_events():
-        while True:
+        while not stop.is_set():
+            # Block until there is work; an idle app does not wake this thread
+            progress_event_queue.wait()
+            if stop.is_set():
+                break
+            
             try:
-                update = progress_event_queue.get(timeout=1.0)  # Longer timeout
-                # Use lambda to capture update correctly
-                def update_ui():
-                    update_ui_during_download(update, components, page)
+                # Let events accumulate for one flush interval, then take them all
+                time.sleep(PROGRESS_FLUSH_INTERVAL)
+                batch = progress_event_queue.drain()
+                if not batch:
+                    continue
                 
-                # Schedule UI update on main thread
-                page.run_thread(update_ui)
+                batch = _coalesce_progress_events(batch)
+                
+                # Schedule one UI update for the whole batch on main thread
+                page.run_thread(_apply_progress_batch, batch, components, page)
                 
-            except queue.Empty:
-                continue
             except Exception as e:
-                print(f"[ERROR] Progress polling error: {e}")
+                log_error("Progress polling error: %s", e)
                 continue
+        
+        # Ring tüm oturumlarda ortak; bekleyen event'ler burada atılmaz
+        log_event("progress_monitoring_stopped")
+    
+    def on_close(e):
+        stop.set()
+        progress_event_queue.wake()
+    
+    # on_disconnect sayfa yenilemede/yeniden bağlanmada da gelir ve oturum devam eder;
+    # thread yalnızca oturum sona erince (on_close) durur
+    page.on_close = on_close
     
     # Start polling thread
-    thread = threading.Thread(target=poll_progress_events, daemon=True)
+    thread = threading.Thread(target=poll_progress_events, name="progress-poll", daemon=True)
     thread.start()
+    return stop
 
-def update_ui_during_download(update: Dict[str, any], components: Dict[str, ft.Control], page: ft.Page) -> None:
-    """Update UI during download process"""
-    print("[DEBUG] Progress event:", update)
-    event_type = update.get("type", "unknown")
-    thread_id = update.get("thread_id", "unknown")
-    video_url = update.get("video_url", "unknown")
-    
-    print(f"[DEBUG] Processing event: type={event_type}, thread={thread_id}, url={video_url}")
-    
-    # Update progress display based on event type
-    if event_type == "progress":
-        # Handle progress updates
-        title = update.get('title', 'Unknown')
-        percent = update.get('percent', 0)
-        speed = update.get('speed', 'Unknown')
-        eta = update.get('eta', 'Unknown')
-        total_size = update.get('total_size', 'Unknown')
-        ext = update.get('ext', 'Unknown')
-        
-        print(f"[DEBUG] Progress: {title} - {percent}% - {speed}")
-        
-        progress_text_line = ft.Text(
-            f"📥 {title} ({ext}) - {percent:.1f}% of {total_size} at {speed} | ETA: {eta}",
-            size=12,
-            color=UI_CONFIG["colors"]["primary"]
-        )
-        
-        # Update or add progress line
-        thread_id = update.get('thread_id', 'unknown')
-        found = False
-        for i, control in enumerate(components["progress_display"].controls):
-            if hasattr(control, 'data') and control.data == thread_id:
-                components["progress_display"].controls[i] = progress_text_line
-                progress_text_line.data = thread_id
-                found = True
-                break
-        
-        if not found:
-            progress_text_line.data = thread_id
-            components["progress_display"].controls.append(progress_text_line)
-        
-        # Update main progress bar
-        components["progress_bar"].value = percent / 100
-        components["info_text"].value = f"Downloading: {title} - {percent:.1f}% of {total_size} at {speed}"
-        components["info_text"].color = None
-        
-    elif event_type == "complete":
-        print(f"[DEBUG] COMPLETE event received for: {video_url}")
-        
-        thread_id = update.get('thread_id', 'unknown')
-        title = update.get('title', 'Unknown')
-        video_url = update.get('video_url')
-        
-        print(f"[DEBUG] Marking as completed: title={title}, url={video_url}")
-        
-        completed_text = ft.Text(
-            f"✅ {title} - Download completed successfully!",
-            size=12,
-            color=UI_CONFIG["colors"]["success"]
-        )
-        
-        for i, control in enumerate(components["progress_display"].controls):
-            if hasattr(control, 'data') and control.data == thread_id:
-                components["progress_display"].controls[i] = completed_text
-                completed_text.data = thread_id
-                break
-        
-        # Update video card status
-        if video_url:
-            print(f"[DEBUG] About to update card status for: {video_url}")
-            update_video_card_status(video_url, "completed", components)
-        
-        # Check if all downloads are complete
-        all_completed = all(
-            "✅" in control.value or "❌" in control.value 
-            for control in components["progress_display"].controls 
-            if hasattr(control, 'value')
-        )
-        
-        if all_completed:
-            components["info_text"].value = "All downloads completed! Videos have been saved to the selected folder. Use 'New Download' for next download."
-            components["info_text"].color = UI_CONFIG["colors"]["success"]
-            components["download_button"].disabled = False
-            components["validate_button"].disabled = False
-            components["progress_bar"].visible = False
-            
-    elif event_type == "error":
-        print(f"[DEBUG] ERROR event received for: {video_url}")
-        
-        thread_id = update.get('thread_id', 'unknown')
-        title = update.get('title', 'Unknown')
-        video_url = update.get('video_url')
-        error_message = update.get('message', 'Unknown error')
-        
-        # Show error in progress display
-        error_text = ft.Text(
-            f"❌ {title} - Error: {error_message[:100]}...",
-            size=12,
-            color=UI_CONFIG["colors"]["error"]
-        )
-        
-        for i, control in enumerate(components["progress_display"].controls):
-            if hasattr(control, 'data') and control.data == thread_id:
-                components["progress_display"].controls[i] = error_text
-                error_text.data = thread_id
-                break
-        
-        # Update video card status
-        if video_url:
-            update_video_card_status(video_url, "error", components)
-        
-        # Show error in main info text
-        components["info_text"].value = f"Download Error: {error_message}"
-        components["info_text"].color = UI_CONFIG["colors"]["error"]
-        
-        # Log detailed error
-        log_event(f"DETAILED_ERROR: thread={thread_id}, url={video_url}, error={error_message}")
-    
-    elif event_type == "status":
-        print(f"[DEBUG] STATUS event: {update.get('message', '')}")
-    
-    elif event_type == "log":
-        # Handle FFmpeg messages
-        message = update.get("message", "")
-        if "FFmpeg is being downloaded" in message:
-            components["info_text"].value = "FFmpeg is being downloaded, please wait..."
-            components["info_text"].color = UI_CONFIG["colors"]["info"]
-        elif "FFmpeg" in message and "successfully" in message:
-            components["info_text"].value = "FFmpeg installation successful!"
-            components["info_text"].color = UI_CONFIG["colors"]["success"]
-    
-    # Update UI once at the end
+def _coalesce_progress_events(batch: List[ProgressUpdate]) -> List[ProgressUpdate]:
+    """
+    Drop superseded progress events from a batch
+    
+    Only the latest "progress" event per (batch, thread_id) is kept (in the slot of the
+    first one); every other event type is kept in arrival order.
+    """
+    coalesced = []
+    progress_slot = {}
+    for update in batch:
+        # thread_id'ler Reset'te yeniden 1'den başlar; eski batch'in indirmesiyle karışmasın
+        key = (update.batch, update.data.get("thread_id"))
+        if update.data.get("type") == "progress":
+            slot = progress_slot.get(key)
+            if slot is None:
+                progress_slot[key] = len(coalesced)
+                coalesced.append(update)
+            else:
+                coalesced[slot] = update
+        else:
+            # Later progress for this thread must not jump ahead of this event
+            progress_slot.pop(key, None)
+            coalesced.append(update)
+    return coalesced
+
+def _apply_progress_batch(batch: List[ProgressUpdate], components: Dict[str, ft.Control], page: ft.Page) -> None:
+    """Apply a batch of progress events and refresh the page once"""
+    for update in batch:
+        update_ui_during_download(update, components, page)
+    
     try:
         page.update()
     except Exception as e:
-        print(f"[ERROR] Page update error: {e}")
-        log_error(f"UI update failed: {e}")
+        log_error("UI update failed: %s", e)
 
-def update_video_card_status(video_url: str, status: str, components: Dict[str, ft.Control]) -> None:
-    """Update video card visual status"""
-    print(f"[DEBUG] Updating video card status: {video_url} -> {status}")
-    log_event(f"card_update: url={video_url}, status={status}")
+def _set_progress_line(components: Dict[str, ft.Control], thread_id: str, value: str, color: str,
+                       recolor: bool = True) -> None:
+    """
+    Update the progress_display line of a download in place, adding it on first use
     
-    if video_url in components["video_cards_dict"]:
-        card = components["video_cards_dict"][video_url]
-        container = card.content
-        
-        if status == "completed":
-            container.bgcolor = "#1B4332"  # Dark green
-            container.border = ft.border.all(2, "#40916C")  # Green border
-            print(f"[DEBUG] Card colored GREEN for: {video_url}")
-        elif status == "error":
-            container.bgcolor = "#4A1A1A"  # Dark red
-            container.border = ft.border.all(2, "#DC2626")  # Red border
-            print(f"[DEBUG] Card colored RED for: {video_url}")
-        
-        try:
-            # Note: page.update() should be called by the caller
-            pass
-        except Exception as e:
-            print(f"[ERROR] Card update error: {e}")
+    With recolor=False an existing line only gets its value changed, so Flet
+    sends just that property.
+    """
+    controls_by_thread = components["progress_controls_by_thread"]
+    line = controls_by_thread.get(thread_id)
+    if line is None:
+        line = ft.Text(value, size=12, color=color, data=thread_id)
+        controls_by_thread[thread_id] = line
+        components["progress_display"].controls.append(line)
+    else:
+        line.value = value
+        if recolor:
+            line.color = color
+
+def _check_all_downloads_finished(components: Dict[str, ft.Control]) -> None:
+    """Re-enable the download controls once every started download has completed or failed"""
+    if components["finished_count"] < components["total_downloads"]:
+        return
+    failed = components["failed_count"]
+    if failed:
+        components["info_text"].value = f"All downloads finished, {failed} failed. Check the progress list for details."
+        components["info_text"].color = _C_ERROR
     else:
-        print(f"[DEBUG] Video URL not found in cards dict: {video_url}")
-        print(f"[DEBUG] Available URLs in dict: {list(components['video_cards_dict'].keys())}")
+        components["info_text"].value = "All downloads completed! Videos have been saved to the selected folder. Use 'New Download' for next download."
+        components["info_text"].color = _C_SUCCESS
+    components["download_button"].disabled = False
+    components["validate_button"].disabled = False
+    components["progress_bar"].visible = False
+
+def _handle_progress_event(event: ProgressUpdate, thread_id: str, components: Dict[str, ft.Control]) -> None:
+    """Show the latest progress of a download"""
+    # Satır ve metni indirme thread'inde hazırlandı
+    row = event.row
+    if _DEBUG:
+        print(f"[DEBUG] Progress: {row.title} - {row.percent}% - {row.speed}")
+    
+    _set_progress_line(components, thread_id, event.display, _C_PRIMARY, recolor=False)
+    
+    card_index = event.card_index
+    if card_index is not None and 0 <= card_index < len(components["video_containers"]):
+        components["video_containers"][card_index].data["status_text"].value = f"{row.percent:.1f}%"
+    
+    # Update main progress bar
+    components["progress_bar"].value = row.percent / 100
+    components["info_text"].value = f"Downloading: {row.title} - {row.percent:.1f}% of {row.size} at {row.speed}"
+    components["info_text"].color = None
+
+def _handle_complete_event(event: ProgressUpdate, thread_id: str, components: Dict[str, ft.Control]) -> None:
+    """Mark a download as completed"""
+    video_url, card_index, update = event.video_url, event.card_index, event.data
+    title = update.get('title', 'Unknown')
+    
+    if _DEBUG:
+        print(f"[DEBUG] Marking as completed: title={title}, url={video_url}")
+    
+    _set_progress_line(
+        components, thread_id,
+        f"✅ {title} - Download completed successfully!",
+        _C_SUCCESS
+    )
+    components["finished_count"] += 1
+    
+    # Update video card status
+    if card_index is not None:
+        update_video_card_status(card_index, "completed", components)
+    
+    _check_all_downloads_finished(components)
+
+def _handle_error_event(event: ProgressUpdate, thread_id: str, components: Dict[str, ft.Control]) -> None:
+    """Mark a download as failed and show the error"""
+    video_url, card_index, update = event.video_url, event.card_index, event.data
+    title = update.get('title', 'Unknown')
+    error_message = update.get('message', 'Unknown error')
+    
+    # Show error in progress display
+    _set_progress_line(
+        components, thread_id,
+        f"❌ {title} - Error: {error_message}",
+        _C_ERROR
+    )
+    components["finished_count"] += 1
+    components["failed_count"] += 1
+    
+    # Update video card status
+    if card_index is not None:
+        update_video_card_status(card_index, "error", components)
+    
+    # Show error in main info text
+    components["info_text"].value = f"Download Error: {error_message}"
+    components["info_text"].color = _C_ERROR
+    
+    # Log detailed error
+    log_event("DETAILED_ERROR", thread=thread_id, url=video_url, error=error_message)
+    
+    # Son indirme hata ile bitse de butonlar yeniden açılmalı
+    _check_all_downloads_finished(components)
+
+def _handle_log_event(event: ProgressUpdate, thread_id: str, components: Dict[str, ft.Control]) -> None:
+    """Surface FFmpeg setup messages from the downloader log"""
+    # Handle FFmpeg messages
+    message = event.data.get("message", "")
+    if "FFmpeg is being downloaded" in message:
+        components["info_text"].value = "FFmpeg is being downloaded, please wait..."
+        components["info_text"].color = _C_INFO
+    elif "FFmpeg" in message and "successfully" in message:
+        components["info_text"].value = "FFmpeg installation successful!"
+        components["info_text"].color = _C_SUCCESS
+
+# Event type -> handler; "status" and unknown types are not shown
+_EVENT_HANDLERS = {
+    "progress": _handle_progress_event,
+    "complete": _handle_complete_event,
+    "error": _handle_error_event,
+    "log": _handle_log_event,
+}
+
+def update_ui_during_download(event: ProgressUpdate, components: Dict[str, ft.Control], page: ft.Page) -> None:
+    """Update UI controls for a single download event (page.update() is left to the caller)"""
+    update = event.data
+    event_type = update.get("type", "unknown")
+    
+    if _DEBUG:
+        print(f"[DEBUG] Processing event: type={event_type}, url={event.video_url}, update={update}")
+    
+    # Reset/yeni doğrulama sonrası gelen eski batch event'leri: kart index'i başka videoya ait olabilir
+    if event.batch != components["download_batch"]:
+        return
+    
+    handler = _EVENT_HANDLERS.get(event_type)
+    if handler is not None:
+        handler(event, update.get("thread_id", "unknown"), components)
+
+def update_video_card_status(card_index: int, status: str, components: Dict[str, ft.Control]) -> None:
+    """Update video card visual status (sent with the next batched page.update())"""
+    if _DEBUG:
+        print(f"[DEBUG] Updating video card status: #{card_index} -> {status}")
+    log_event("card_update", index=card_index, status=status)
+    
+    video_containers = components["video_containers"]
+    if len(video_containers) <= card_index < len(components["validated_videos"]):
+        # Card not built yet (lazy list); applied when it is
+        components["pending_card_status"][card_index] = status
+        return
+    if not 0 <= card_index < len(video_containers):
+        if _DEBUG:
+            print(f"[DEBUG] Card index out of range: {card_index}")
+        return
+    
+    style = _CARD_STYLES.get(status)
+    if style is None:
+        return
+    container = video_containers[card_index]
+    status_text = container.data["status_text"]
+    status_text.value, status_text.color, container.bgcolor, container.border = style
 
 def main(page: ft.Page):
     app_ui = create_app_ui(page)
@@ -7,49 +7,124 @@ import subprocess
 import os
 import sys
 import shutil
+import time
+import math
+import queue
+import atexit
+import threading
 from datetime import datetime
-from typing import Optional, Dict, Any
+from urllib.parse import urlparse
+from functools import lru_cache
+from typing import Optional, Dict, Any, List
 
 # Application constants
 LOG_FILE = "app_log.txt"
 MAX_LOG_SIZE = 10 * 1024 * 1024  # 10MB
 
-def check_yt_dlp() -> bool:
+# Units used by format_bytes, in steps of 1024
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Hostnames accepted by validate_url
+YOUTUBE_HOSTS = frozenset({
+    "youtube.com", "youtu.be", "www.youtube.com",
+    "m.youtube.com", "music.youtube.com"
+})
+
+# Log levels in increasing severity; messages below LOG_LEVEL are discarded
+# before any formatting happens
+LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+LOG_LEVEL = os.environ.get("YTDLP_GUI_LOG_LEVEL", "INFO").upper()
+_LOG_THRESHOLD = LOG_LEVELS.get(LOG_LEVEL, LOG_LEVELS["INFO"])
+
+# Log records are formatted and written by a background thread; callers only
+# enqueue a tuple. A batch is written once it holds LOG_BATCH_SIZE records or
+# LOG_FLUSH_INTERVAL seconds after its first record, whichever comes first.
+LOG_FLUSH_INTERVAL = 0.25
+LOG_BATCH_SIZE = 200
+LOG_WRITE_BUFFER = 64 * 1024
+_LOG_QUEUE: "queue.SimpleQueue" = queue.SimpleQueue()
+_log_writer_lock = threading.Lock()
+_log_writer_thread: Optional[threading.Thread] = None
+# Queued by the atexit hook: the writer writes what it holds and exits
+_LOG_STOP = object()
+LOG_EXIT_TIMEOUT = 2.0
+# Bytes written since the log file size was last checked; only the writer
+# thread touches it, and the file is stat'ed once it passes MAX_LOG_SIZE
+_log_size: Optional[int] = None
+
+@lru_cache(maxsize=1)
+def get_yt_dlp_version() -> Optional[str]:
     """
-    Check if yt-dlp is installed and accessible
+    Get the installed yt-dlp version
+    
+    The result is cached for the process lifetime; call
+    refresh_tool_checks() to probe again.
     
     Returns:
-        bool: True if yt-dlp is available, False otherwise
+        Version string, or None if yt-dlp is not installed or does not run
     """
+    if shutil.which("yt-dlp") is None:
+        return None
     try:
         result = subprocess.run(
             ["yt-dlp", "--version"], 
-            check=True, 
             capture_output=True, 
+            text=True,
             timeout=10
         )
-        return result.returncode == 0
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        return False
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
 
+def check_yt_dlp() -> bool:
+    """
+    Check if yt-dlp is installed and accessible
+    
+    Uses the cached get_yt_dlp_version() probe.
+    
+    Returns:
+        bool: True if yt-dlp is available, False otherwise
+    """
+    return get_yt_dlp_version() is not None
+
+@lru_cache(maxsize=1)
 def check_ffmpeg() -> bool:
     """
     Check if FFmpeg is installed and accessible
     
+    The result is cached for the process lifetime; call
+    refresh_tool_checks() to probe again.
+    
     Returns:
         bool: True if FFmpeg is available, False otherwise
     """
+    if shutil.which("ffmpeg") is None:
+        return False
     try:
         result = subprocess.run(
             ["ffmpeg", "-version"], 
             check=True, 
             capture_output=True, 
-            timeout=10
+            timeout=5
         )
         return result.returncode == 0
     except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
         return False
 
+def refresh_tool_checks() -> None:
+    """
+    Forget failed yt-dlp/FFmpeg probe results so the next check runs again
+    
+    Successful results stay cached, so calling this before every check only
+    costs a process spawn while a tool is still missing.
+    """
+    for probe in (get_yt_dlp_version, check_ffmpeg):
+        # currsize is checked first so an uncached probe is not run here
+        if probe.cache_info().currsize and not probe():
+            probe.cache_clear()
+
 def get_disk_space(path: str) -> Optional[Dict[str, float]]:
     """
     Get disk space information for a given path
@@ -82,14 +157,47 @@ def format_bytes(bytes_size: int) -> str:
     """
     if bytes_size == 0:
         return "0 B"
+    if bytes_size < 1024:
+        return f"{bytes_size:.1f} B"
     
-    units = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    while bytes_size >= 1024 and i < len(units) - 1:
-        bytes_size /= 1024
+    i = min(int(math.log(bytes_size, 1024)), len(_UNITS) - 1)
+    # Correct float rounding at exact powers of 1024 (log may give 2.9999...)
+    if i < len(_UNITS) - 1 and bytes_size >= 1024 ** (i + 1):
         i += 1
     
-    return f"{bytes_size:.1f} {units[i]}"
+    return f"{bytes_size / 1024 ** i:.1f} {_UNITS[i]}"
+
+def tail_lines(path: str, max_bytes: int = 8192, n: int = 50) -> List[str]:
+    """
+    Read the last lines of a text file without loading the whole file
+    
+    Args:
+        path: File path
+        max_bytes: Maximum number of bytes to read from the end of the file
+        n: Maximum number of lines to return
+        
+    Returns:
+        Up to n trailing lines (the first one may be partial if the
+        file is larger than max_bytes)
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        f.seek(max(0, size - max_bytes))
+        text = f.read().decode("utf-8", errors="replace")
+    return text.splitlines()[-n:]
+
+def count_lines(path: str) -> int:
+    """
+    Count newline-terminated lines in a file using fixed-size binary reads
+    
+    Args:
+        path: File path
+        
+    Returns:
+        Number of lines in the file
+    """
+    with open(path, "rb") as f:
+        return sum(buf.count(b"\n") for buf in iter(lambda: f.read(1 << 16), b""))
 
 def validate_url(url: str) -> bool:
     """
@@ -104,64 +212,190 @@ def validate_url(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
     
-    youtube_domains = [
-        "youtube.com", "youtu.be", "www.youtube.com", 
-        "m.youtube.com", "music.youtube.com"
-    ]
+    url = url.strip()
+    # Also accept scheme-less input such as "youtube.com/watch?v=..."
+    if "://" not in url:
+        url = "https://" + url
+    try:
+        host = urlparse(url).hostname
+    except ValueError:
+        return False
     
-    return any(domain in url.lower() for domain in youtube_domains)
+    return host is not None and host in YOUTUBE_HOSTS
 
-def cleanup_log_file() -> None:
-    """Clean up log file if it exceeds maximum size"""
+def cleanup_log_file() -> int:
+    """
+    Clean up log file if it exceeds maximum size
+    
+    Keeps the second half of the file, starting at the first full line, and
+    copies it through a fixed-size buffer instead of reading it into memory.
+    
+    Returns:
+        int: Size of the log file in bytes after cleanup (0 if it is missing)
+    """
+    tmp_file = LOG_FILE + ".tmp"
     try:
-        if os.path.exists(LOG_FILE):
-            if os.path.getsize(LOG_FILE) > MAX_LOG_SIZE:
-                # Keep only the last 50% of the file
-                with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                
-                keep_lines = len(lines) // 2
-                with open(LOG_FILE, 'w', encoding='utf-8') as f:
-                    f.writelines(lines[-keep_lines:])
-                    f.write(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] LOG_CLEANUP: Log file rotated\n")
+        with open(LOG_FILE, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= MAX_LOG_SIZE:
+                return size
+            # Keep only the last 50% of the file
+            f.seek(size // 2)
+            f.readline()  # Discard the partial line
+            with open(tmp_file, "wb") as out:
+                shutil.copyfileobj(f, out, LOG_WRITE_BUFFER)
+                out.write(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] LOG_CLEANUP: Log file rotated\n".encode("utf-8"))
+                new_size = out.tell()
+        os.replace(tmp_file, LOG_FILE)
+        return new_size
     except Exception:
-        pass  # Ignore cleanup errors
+        # Do not leave a half-written copy next to the log
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        return 0  # Ignore cleanup errors
+
+def _format_log_entry(created: float, level: str, message: str, args: tuple, fields: Dict[str, Any]) -> str:
+    """Format a queued log record as a log file line"""
+    if args:
+        try:
+            message = message % args
+        except (TypeError, ValueError):
+            # Not a %-format call (e.g. an old log_event("msg", "ERROR")); keep the arguments visible
+            message = f"{message} {args!r}"
+    if fields:
+        separator = ", " if ":" in message else ": "
+        message = message + separator + ", ".join(f"{key}={value}" for key, value in fields.items())
+    timestamp = datetime.fromtimestamp(created).strftime('%Y-%m-%d %H:%M:%S')
+    return f"[{timestamp}] {level}: {message}\n"
+
+def _write_log_entries(records: List[tuple]) -> None:
+    """Format queued records and append them to the log file in one write"""
+    lines = []
+    for record in records:
+        try:
+            lines.append(_format_log_entry(*record))
+        except Exception:
+            continue  # Skip records that fail to format
+    
+    # Clean up log file if needed
+    global _log_size
+    if _log_size is None or _log_size > MAX_LOG_SIZE:
+        _log_size = cleanup_log_file()
+    
+    with open(LOG_FILE, "a", encoding="utf-8", buffering=LOG_WRITE_BUFFER) as f:
+        f.writelines(lines)
+        _log_size = f.tell()  # Byte offset at the end of the file
+
+def _drain_log_queue() -> List[tuple]:
+    """Take every record currently waiting in the log queue"""
+    records = []
+    while True:
+        try:
+            records.append(_LOG_QUEUE.get_nowait())
+        except queue.Empty:
+            return records
+
+def _log_writer() -> None:
+    """Background thread that batches queued log records into the log file"""
+    stopping = False
+    while not stopping:
+        record = _LOG_QUEUE.get()
+        if record is _LOG_STOP:
+            return
+        records = [record]
+        deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+        while len(records) < LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                record = _LOG_QUEUE.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if record is _LOG_STOP:
+                # Write the batch held so far before exiting
+                stopping = True
+                break
+            records.append(record)
+        try:
+            _write_log_entries(records)
+        except Exception:
+            pass  # Ignore logging errors to prevent cascading failures
 
-def log_event(message: str, level: str = "INFO") -> None:
+def _flush_log_queue() -> None:
+    """
+    Stop the writer and write every pending record (registered to run at
+    interpreter exit)
+    
+    The writer may be holding a batch it has already taken from the queue, so
+    it is asked to finish that batch and exit before the rest is written here.
+    """
+    writer = _log_writer_thread
+    if writer is not None and writer.is_alive():
+        _LOG_QUEUE.put(_LOG_STOP)
+        writer.join(LOG_EXIT_TIMEOUT)
+        if writer.is_alive():
+            return  # Writer is stuck in a write; do not interleave with it
+    records = [record for record in _drain_log_queue() if record is not _LOG_STOP]
+    if records:
+        try:
+            _write_log_entries(records)
+        except Exception:
+            pass
+
+def _ensure_log_writer() -> None:
+    """Start the background log writer on first use"""
+    global _log_writer_thread
+    with _log_writer_lock:
+        if _log_writer_thread is None:
+            _log_writer_thread = threading.Thread(target=_log_writer, name="log-writer", daemon=True)
+            _log_writer_thread.start()
+            atexit.register(_flush_log_queue)
+
+def log_event(message: str, *args: Any, level: str = "INFO", **fields: Any) -> None:
     """
     Log an event with timestamp and level
     
+    The record is handed to a background writer thread, which does the
+    formatting and the file write. Hot paths should therefore pass values as
+    %-style args or keyword fields instead of building an f-string:
+    log_event("download_start: thread_id=%s", thread_id) or
+    log_event("user_action: validate_url_clicked", url=url), the latter being
+    written as "user_action: validate_url_clicked, url=...".
+    
     Args:
-        message: Log message
+        message: Log message, optionally a %-format string
+        *args: Values for the %-format placeholders in message
         level: Log level (INFO, WARNING, ERROR, DEBUG)
+        **fields: Optional key/value pairs appended to the message
     """
+    if LOG_LEVELS.get(level, LOG_LEVELS["INFO"]) < _LOG_THRESHOLD:
+        return
+    
     try:
-        # Clean up log file if needed
-        cleanup_log_file()
-        
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_entry = f"[{timestamp}] {level}: {message}\n"
+        if _log_writer_thread is None:
+            _ensure_log_writer()
+        _LOG_QUEUE.put((time.time(), level, message, args, fields))
         
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(log_entry)
-            
         # Also print to console for debugging
         if level in ["ERROR", "WARNING"]:
-            print(f"[{level}] {message}")
+            print(f"[{level}] {message % args if args else message}")
     except Exception:
         pass  # Ignore logging errors to prevent cascading failures
 
-def log_error(message: str) -> None:
+def log_error(message: str, *args: Any, **fields: Any) -> None:
     """Log an error message"""
-    log_event(message, "ERROR")
+    log_event(message, *args, level="ERROR", **fields)
 
-def log_warning(message: str) -> None:
+def log_warning(message: str, *args: Any, **fields: Any) -> None:
     """Log a warning message"""
-    log_event(message, "WARNING")
+    log_event(message, *args, level="WARNING", **fields)
 
-def log_debug(message: str) -> None:
+def log_debug(message: str, *args: Any, **fields: Any) -> None:
     """Log a debug message"""
-    log_event(message, "DEBUG")
+    log_event(message, *args, level="DEBUG", **fields)
 
 def get_system_info() -> Dict[str, Any]:
     """